@@ -1,11 +1,16 @@
 """PC Monitor - System tray application with real-time hardware monitoring dashboard."""
 
+import asyncio
 import threading
 import webbrowser
 import sys
 import os
 import subprocess
 import atexit
+import logging
+import logging.handlers
+import queue
+import tempfile
 import time
 
 # Add the project root to path for imports
@@ -16,20 +21,46 @@ LHM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools", "Li
 
 import pystray
 from PIL import Image, ImageDraw
-import uvicorn
+
+log = logging.getLogger(__name__)
 
 # Server configuration
 HOST = "127.0.0.1"
 PORT = 8080
 BASE_URL = f"http://{HOST}:{PORT}"
 
+# Pre-rendered tray icon, reused across launches
+ICON_CACHE = os.path.join(tempfile.gettempdir(), "pc_monitor_tray.png")
+
 # Global server instance
 server = None
-server_thread = None
+
+
+def setup_logging():
+    """Route log records through a queue so handler I/O happens off the event loop."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.WARNING)
+    # The app's own startup messages (e.g. LibreHardwareMonitor status) are informational
+    log.setLevel(logging.INFO)
+
+    listener.start()
+    return listener
 
 
 def create_icon_image():
-    """Create a simple monitor icon for the system tray."""
+    """Create a simple monitor icon for the system tray (cached on disk)."""
+    try:
+        with Image.open(ICON_CACHE) as cached:
+            return cached.copy()
+    except (OSError, ValueError):
+        pass
+
     # Create a 64x64 image with a monitor/chart icon
     size = 64
     image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
@@ -66,32 +97,95 @@ def create_icon_image():
             fill='#00ff88'
         )
 
+    try:
+        image.save(ICON_CACHE, "PNG", optimize=True)
+    except OSError:
+        pass
+
     return image
 
 
 def is_lhm_running():
-    """Check if LibreHardwareMonitor is already running."""
+    """Check if LibreHardwareMonitor is already running (Toolhelp process snapshot)."""
     try:
-        result = subprocess.run(
-            ["tasklist", "/FI", "IMAGENAME eq LibreHardwareMonitor.exe"],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
-        return "LibreHardwareMonitor.exe" in result.stdout
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", ctypes.c_long),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", ctypes.c_wchar * 260),
+            ]
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+        TH32CS_SNAPPROCESS = 0x00000002
+        INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+            return False
+
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while found:
+                if entry.szExeFile.lower() == "librehardwaremonitor.exe":
+                    return True
+                found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+            return False
+        finally:
+            kernel32.CloseHandle(snapshot)
     except Exception:
         return False
 
 
+def _wait_lhm_wmi(timeout=10.0):
+    """Wait until LibreHardwareMonitor's WMI provider answers sensor queries."""
+    try:
+        import wmi
+    except ImportError:
+        return False
+
+    deadline = time.monotonic() + timeout
+    delay = 0.025
+    while True:
+        try:
+            if wmi.WMI(namespace="root\\LibreHardwareMonitor").Sensor():
+                return True
+        except Exception:
+            pass
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.2)
+
+
 def start_lhm():
     """Start LibreHardwareMonitor in the background with admin privileges."""
     if not os.path.exists(LHM_PATH):
-        print(f"LibreHardwareMonitor not found at: {LHM_PATH}")
+        log.warning("LibreHardwareMonitor not found at: %s", LHM_PATH)
         return
 
     # Don't start if already running
     if is_lhm_running():
-        print("LibreHardwareMonitor already running")
+        log.info("LibreHardwareMonitor already running")
         return
 
     try:
@@ -109,9 +203,9 @@ def start_lhm():
         )
         # ShellExecuteW returns > 32 on success
         if result <= 32:
-            print(f"Failed to start LibreHardwareMonitor, error code: {result}")
+            log.warning("Failed to start LibreHardwareMonitor, error code: %s", result)
     except Exception as e:
-        print(f"Could not start LibreHardwareMonitor: {e}")
+        log.warning("Could not start LibreHardwareMonitor: %s", e)
 
 
 def stop_lhm():
@@ -134,15 +228,18 @@ def open_dashboard():
 def exit_app(icon: pystray.Icon):
     """Exit the application and stop the server."""
     stop_lhm()
-    icon.stop()
     if server:
         server.should_exit = True
+    icon.stop()
 
 
-def run_server():
-    """Run the uvicorn server in a separate thread."""
+async def run_server():
+    """Run the uvicorn server on the current asyncio loop."""
     global server
 
+    # Imported here so it stays off the critical path to the tray icon
+    import uvicorn
+
     config = uvicorn.Config(
         "monitor.server:app",
         host=HOST,
@@ -151,7 +248,7 @@ def run_server():
         access_log=False,
     )
     server = uvicorn.Server(config)
-    server.run()
+    await server.serve()
 
 
 def setup_tray(icon: pystray.Icon):
@@ -161,7 +258,7 @@ def setup_tray(icon: pystray.Icon):
 
 def main():
     """Main entry point."""
-    global server_thread
+    log_listener = setup_logging()
 
     # Register cleanup on exit
     atexit.register(stop_lhm)
@@ -169,16 +266,8 @@ def main():
     # Start LibreHardwareMonitor for fan/sensor data
     start_lhm()
 
-    # Wait for LHM to initialize (up to 10 seconds)
-    for _ in range(20):
-        if is_lhm_running():
-            time.sleep(1)  # Give it a moment to initialize WMI
-            break
-        time.sleep(0.5)
-
-    # Start the web server in a background thread
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
+    # Wait for LHM's WMI sensors to come online (up to 10 seconds)
+    _wait_lhm_wmi()
 
     # Create the system tray icon
     icon_image = create_icon_image()
@@ -196,8 +285,17 @@ def main():
         menu=menu,
     )
 
-    # Run the tray icon (this blocks)
-    icon.run(setup_tray)
+    # Run the tray icon in a worker thread
+    tray_thread = threading.Thread(target=icon.run, args=(setup_tray,))
+    tray_thread.start()
+
+    # Run the web server on the main thread (this blocks until exit_app)
+    try:
+        asyncio.run(run_server())
+    finally:
+        icon.stop()
+        tray_thread.join(timeout=5)
+        log_listener.stop()
 
 
 if __name__ == "__main__":
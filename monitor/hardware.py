@@ -1,17 +1,23 @@
 """Hardware monitoring module for collecting system statistics."""
 
+import asyncio
+import atexit
+import functools
+import heapq
+import importlib.util
+import json
+import os
+import platform
 import psutil
 import subprocess
 import re
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Final
 
-# Try to import WMI for detailed hardware info on Windows
-try:
-    import wmi
-    WMI_AVAILABLE = True
-except ImportError:
-    WMI_AVAILABLE = False
+# WMI for detailed hardware info on Windows (imported on first use, it pulls in pywin32/COM)
+WMI_AVAILABLE = importlib.util.find_spec('wmi') is not None
 
 # Try to import GPU libraries
 try:
@@ -20,78 +26,265 @@ try:
 except ImportError:
     PYNVML_AVAILABLE = False
 
+# GPUtil is only needed when NVML is unusable (imported on first use)
+GPUTIL_AVAILABLE = importlib.util.find_spec('GPUtil') is not None
+
+# Try to import icmplib for subprocess-free ping
 try:
-    import GPUtil
-    GPUTIL_AVAILABLE = True
+    import icmplib
+    ICMPLIB_AVAILABLE = True
 except ImportError:
-    GPUTIL_AVAILABLE = False
+    ICMPLIB_AVAILABLE = False
+
+# On-disk cache for static hardware info (WMI enumeration is slow)
+CACHE_DIR = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'pc_monitor'
+)
+MEMORY_INFO_CACHE = os.path.join(CACHE_DIR, 'meminfo.json')
+
+# Bytes -> MiB scale for I/O rates (multiply instead of divide per tick)
+_INV_MIB = 1.0 / (1024 * 1024)
+
+# Current frequency of the first core (Linux cpufreq, in kHz)
+CPU0_FREQ_PATH = '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq'
+
+# Linux memory counters read every tick through a persistent descriptor (see _read_proc)
+PROC_MEMINFO_PATH = '/proc/meminfo'
+
+# NVML field IDs for GPU power draw and limit (milliwatts), read in one batched call.
+# Instantaneous draw matches nvmlDeviceGetPowerUsage; AVERAGE only if INSTANT isn't defined.
+# Older pynvml releases define neither; the per-metric calls are used instead.
+_NVML_POWER_FIELDS = [
+    getattr(pynvml, 'NVML_FI_DEV_POWER_INSTANT', None)
+    or getattr(pynvml, 'NVML_FI_DEV_POWER_AVERAGE', None),
+    getattr(pynvml, 'NVML_FI_DEV_POWER_CURRENT_LIMIT', None),
+] if PYNVML_AVAILABLE else [None, None]
+
+# nvmlValue_t union member for each NVML value type
+_NVML_VALUE_MEMBERS = {0: 'dVal', 1: 'uiVal', 2: 'ulVal', 3: 'ullVal', 4: 'sllVal', 5: 'siVal'}
+
+# SMBIOS memory type codes reported by Win32_PhysicalMemory
+_SMBIOS_MEMORY_TYPES: Final[dict[int, str]] = {
+    0: 'Unknown',
+    1: 'Other',
+    2: 'DRAM',
+    3: 'Synchronous DRAM',
+    4: 'Cache DRAM',
+    5: 'EDO',
+    6: 'EDRAM',
+    7: 'VRAM',
+    8: 'SRAM',
+    9: 'RAM',
+    10: 'ROM',
+    11: 'Flash',
+    12: 'EEPROM',
+    13: 'FEPROM',
+    14: 'EPROM',
+    15: 'CDRAM',
+    16: '3DRAM',
+    17: 'SDRAM',
+    18: 'SGRAM',
+    19: 'RDRAM',
+    20: 'DDR',
+    21: 'DDR2',
+    22: 'DDR2 FB-DIMM',
+    24: 'DDR3',
+    26: 'DDR4',
+    34: 'DDR5',
+}
+
+# Hardware monitor (LHM/OHM) sensors needed for fan stats
+_FAN_SENSOR_WQL = "SELECT Name, Value, SensorType FROM Sensor WHERE SensorType='Fan' OR SensorType='Control'"
+
+# Ping round-trip time in raw ping output (Windows format: "time=XXms" or "time<1ms")
+_PING_RE = re.compile(rb'time[=<](\d+)ms', re.IGNORECASE)
+
+
+def ttl_cache(seconds: float):
+    """Cache a HardwareMonitor method's result per instance for ``seconds``.
+
+    Metrics change at different rates, so each collector refreshes on its own
+    schedule. The cache is keyed on the call arguments.
+    """
+    def decorator(method):
+        attr = f'_{method.__name__}_cache'
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = getattr(self, attr, None)  # (key, value, timestamp)
+            if cached is not None and cached[0] == key and (now - cached[2]) < seconds:
+                return cached[1]
+
+            value = method(self, *args, **kwargs)
+            setattr(self, attr, (key, value, now))
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def init_worker_thread():
+    """Initialize COM in a stats worker thread so WMI can be used there (pool initializer)."""
+    if WMI_AVAILABLE:
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except Exception:
+            pass
 
 
 class HardwareMonitor:
     """Collects hardware statistics from the system."""
 
     def __init__(self):
+        # NVML device handles and static per-device info (filled by _init_nvml)
+        self._nvml_handles = []
+        self._nvml_names = []
+        self._nvml_num_fans = []
+        self._nvml_field_values_supported = None not in _NVML_POWER_FIELDS
+        # WMI connections, cached per namespace for each thread (COM objects are thread-bound)
+        self._wmi_local = threading.local()
         self._nvml_initialized = False
+        # NVML calls are serialized across collector threads
+        self._nvml_lock = threading.Lock()
         self._init_nvml()
         self._memory_hardware_info = None
         self._init_memory_hardware_info()
         self._cpu_hardware_info = None
         self._init_cpu_hardware_info()
+        # Static fields, sent once per client via get_static_stats()
+        self._cpu_static = self._static_fields(
+            self._cpu_hardware_info, ['name', 'max_clock', 'l2_cache_kb', 'l3_cache_kb', 'socket'])
+        self._memory_static = self._static_fields(
+            self._memory_hardware_info, ['speed', 'type', 'slots_used', 'slots_total', 'modules'])
+        # Core counts never change
+        self._cpu_cores = psutil.cpu_count(logical=False)
+        self._cpu_threads = psutil.cpu_count(logical=True)
+        # Max CPU frequency never changes; current is sampled on its own TTL
+        try:
+            cpu_freq = psutil.cpu_freq()
+        except Exception:
+            cpu_freq = None
+        self._cpu_freq_max = cpu_freq.max if cpu_freq else None
+        # On Linux, read cpu0's frequency directly instead of globbing every core
+        try:
+            self._cpu_freq_fd = os.open(CPU0_FREQ_PATH, os.O_RDONLY)
+        except (OSError, AttributeError):
+            self._cpu_freq_fd = None
+        # On Linux, keep the per-tick /proc files open and re-read them with pread
+        self._proc_fds: dict[str, int] = {}
+        for path in (PROC_MEMINFO_PATH,):
+            try:
+                self._proc_fds[path] = os.open(path, os.O_RDONLY)
+            except (OSError, AttributeError):
+                pass
         self._system_hardware_info = None
         self._init_system_hardware_info()
-        # Fan stats cache (WMI queries are expensive)
-        self._fan_cache = None
-        self._fan_cache_time = 0
-        self._fan_cache_ttl = 1.5  # Cache for 1.5 seconds
+        self._fan_namespace = None  # WMI namespace that last returned fans
+        self._proc_cache: dict[int, psutil.Process] = {}
+        self._proc_warm = False  # True after the first CPU sampling pass
+        # Previous I/O byte counters as (bytes_a, bytes_b, monotonic_ns) for rate calculation
+        self._disk_last = None
+        self._net_last = None
+        # CPU temperature methods, last success first; failed ones sit out a cooldown
+        self._temp_methods = ['psutil']
+        if WMI_AVAILABLE:
+            self._temp_methods += ['msacpi', 'ohm', 'lhm']
+        self._temp_failed_until: dict[str, float] = {}
+        # Ping cache (each ping waits on a network round trip)
+        self._ping_cache = None
+        self._ping_cache_time = 0
+        self._ping_cache_ttl = 2.0  # Cache for 2 seconds
+        self._icmp_supported = True  # Cleared if ICMP sockets aren't permitted
+        # Shared snapshot so concurrent callers don't multiply collection cost
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = None
+        self._snapshot_time = 0
+        self._snapshot_ttl = 0.25  # Cache for 250ms
+        # In-flight collector futures by stats key; a collector still running past
+        # the snapshot deadline is awaited again, never started a second time
+        self._collector_futures: dict[str, Future] = {}
+        # Collectors run concurrently in get_all_stats
+        self._pool = ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="hwstats",
+            initializer=init_worker_thread,
+        )
+
+    def _wmi_conns(self) -> dict[str, Any]:
+        """Get the current thread's WMI connections, keyed by namespace."""
+        conns = getattr(self._wmi_local, 'conns', None)
+        if conns is None:
+            conns = self._wmi_local.conns = {}
+        return conns
+
+    def _wmi(self, namespace: str = "root\\cimv2"):
+        """Get a cached WMI connection for a namespace on the current thread."""
+        conns = self._wmi_conns()
+        conn = conns.get(namespace)
+        if conn is None:
+            import wmi
+            conn = conns[namespace] = wmi.WMI(namespace=namespace)
+        return conn
+
+    def _wmi_query(self, namespace: str, query: Callable[[Any], Any]) -> Any:
+        """Run a query on a cached WMI connection, reconnecting once if it went stale."""
+        was_cached = namespace in self._wmi_conns()
+        try:
+            return query(self._wmi(namespace))
+        except Exception:
+            if not was_cached:
+                raise
+            # Provider restarted (e.g. LHM relaunched): drop the connection and retry
+            self._wmi_conns().pop(namespace, None)
+            return query(self._wmi(namespace))
 
     def _init_memory_hardware_info(self):
-        """Initialize static memory hardware info (speed, type, slots) via WMI."""
+        """Initialize static memory hardware info (speed, type, slots), cached on disk."""
         if not WMI_AVAILABLE:
             self._memory_hardware_info = {'available': False}
             return
 
+        fingerprint = f"{platform.node()}:{psutil.virtual_memory().total}"
+
+        # Reuse the cached result if the hardware looks unchanged
+        try:
+            with open(MEMORY_INFO_CACHE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('fingerprint') == fingerprint:
+                self._memory_hardware_info = cached['info']
+                return
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        self._memory_hardware_info = self._query_memory_hardware_info()
+
+        if self._memory_hardware_info.get('available'):
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                tmp_path = MEMORY_INFO_CACHE + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'fingerprint': fingerprint, 'info': self._memory_hardware_info}, f)
+                os.replace(tmp_path, MEMORY_INFO_CACHE)
+            except OSError:
+                pass
+
+    def _query_memory_hardware_info(self) -> dict[str, Any]:
+        """Query memory hardware info (speed, type, slots) via WMI."""
         try:
-            w = wmi.WMI()
+            w = self._wmi()
             memory_modules = w.Win32_PhysicalMemory()
 
             if not memory_modules:
-                self._memory_hardware_info = {'available': False}
-                return
+                return {'available': False}
 
             slots = []
             total_speed = 0
             memory_type_code = None
 
-            # Memory type mapping (SMBIOS memory type)
-            memory_types = {
-                0: 'Unknown',
-                1: 'Other',
-                2: 'DRAM',
-                3: 'Synchronous DRAM',
-                4: 'Cache DRAM',
-                5: 'EDO',
-                6: 'EDRAM',
-                7: 'VRAM',
-                8: 'SRAM',
-                9: 'RAM',
-                10: 'ROM',
-                11: 'Flash',
-                12: 'EEPROM',
-                13: 'FEPROM',
-                14: 'EPROM',
-                15: 'CDRAM',
-                16: '3DRAM',
-                17: 'SDRAM',
-                18: 'SGRAM',
-                19: 'RDRAM',
-                20: 'DDR',
-                21: 'DDR2',
-                22: 'DDR2 FB-DIMM',
-                24: 'DDR3',
-                26: 'DDR4',
-                34: 'DDR5',
-            }
-
             for module in memory_modules:
                 capacity_gb = int(module.Capacity) / (1024 ** 3) if module.Capacity else 0
                 speed = module.Speed or 0
@@ -114,7 +307,7 @@ class HardwareMonitor:
                 if memory_type_code is None:
                     memory_type_code = mem_type
 
-            memory_type = memory_types.get(memory_type_code, 'Unknown')
+            memory_type = _SMBIOS_MEMORY_TYPES.get(memory_type_code, 'Unknown')
 
             # Get total slots (including empty)
             try:
@@ -123,7 +316,7 @@ class HardwareMonitor:
             except Exception:
                 total_slots = len(slots)
 
-            self._memory_hardware_info = {
+            return {
                 'available': True,
                 'speed': total_speed,
                 'type': memory_type,
@@ -134,17 +327,24 @@ class HardwareMonitor:
             }
 
         except Exception as e:
-            self._memory_hardware_info = {'available': False, 'error': str(e)}
+            return {'available': False, 'error': str(e)}
 
     def _init_cpu_hardware_info(self):
-        """Initialize static CPU hardware info via WMI."""
+        """Initialize static CPU hardware info from the registry, with WMI for cache sizes."""
         if not WMI_AVAILABLE:
             self._cpu_hardware_info = {'available': False}
             return
 
+        # Name and clock from the registry avoid a full Win32_Processor enumeration
+        registry_info = self._read_cpu_registry()
+
         try:
-            w = wmi.WMI()
-            cpus = w.Win32_Processor()
+            # Only select the columns we need (much cheaper than SELECT *)
+            if registry_info:
+                columns = "L2CacheSize, L3CacheSize, SocketDesignation"
+            else:
+                columns = "Name, MaxClockSpeed, L2CacheSize, L3CacheSize, SocketDesignation"
+            cpus = self._wmi().query(f"SELECT {columns} FROM Win32_Processor")
 
             if not cpus:
                 self._cpu_hardware_info = {'available': False}
@@ -152,8 +352,13 @@ class HardwareMonitor:
 
             cpu = cpus[0]  # Get first CPU
 
+            if registry_info:
+                name, max_clock = registry_info
+            else:
+                name = cpu.Name or 'Unknown CPU'
+                max_clock = cpu.MaxClockSpeed
+
             # Clean up CPU name
-            name = cpu.Name or 'Unknown CPU'
             name = ' '.join(name.split())  # Remove extra whitespace
 
             # Cache sizes in KB
@@ -163,7 +368,7 @@ class HardwareMonitor:
             self._cpu_hardware_info = {
                 'available': True,
                 'name': name,
-                'max_clock': cpu.MaxClockSpeed,
+                'max_clock': max_clock,
                 'l2_cache_kb': l2_cache,
                 'l3_cache_kb': l3_cache,
                 'socket': cpu.SocketDesignation,
@@ -172,6 +377,21 @@ class HardwareMonitor:
         except Exception as e:
             self._cpu_hardware_info = {'available': False, 'error': str(e)}
 
+    @staticmethod
+    def _read_cpu_registry() -> tuple[str, int] | None:
+        """Read CPU name and clock speed (MHz) from the Windows registry."""
+        try:
+            import winreg
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+            ) as key:
+                name = winreg.QueryValueEx(key, "ProcessorNameString")[0]
+                mhz = winreg.QueryValueEx(key, "~MHz")[0]
+            return name or 'Unknown CPU', mhz
+        except (ImportError, OSError):
+            return None
+
     def _init_system_hardware_info(self):
         """Initialize static system hardware info (motherboard, BIOS, OS, storage) via WMI."""
         if not WMI_AVAILABLE:
@@ -179,7 +399,7 @@ class HardwareMonitor:
             return
 
         try:
-            w = wmi.WMI()
+            w = self._wmi()
 
             # Motherboard info
             motherboard = {}
@@ -278,6 +498,13 @@ class HardwareMonitor:
         except Exception as e:
             self._system_hardware_info = {'available': False, 'error': str(e)}
 
+    @staticmethod
+    def _static_fields(info: dict[str, Any] | None, keys: list[str]) -> dict[str, Any]:
+        """Pick the static fields reported alongside live stats from a hardware info dict."""
+        if not info or not info.get('available'):
+            return {}
+        return {key: info.get(key) for key in keys}
+
     def _init_nvml(self):
         """Initialize NVIDIA Management Library."""
         if PYNVML_AVAILABLE and not self._nvml_initialized:
@@ -286,22 +513,53 @@ class HardwareMonitor:
                 self._nvml_initialized = True
             except Exception:
                 self._nvml_initialized = False
+                return
 
-    def _shutdown_nvml(self):
-        """Shutdown NVIDIA Management Library."""
-        if self._nvml_initialized:
+            # Device handles, names and fan counts don't change while initialized
             try:
-                pynvml.nvmlShutdown()
+                count = pynvml.nvmlDeviceGetCount()
+                self._nvml_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(count)]
             except Exception:
-                pass
-            self._nvml_initialized = False
+                self._nvml_handles = []
+
+            self._nvml_names = []
+            self._nvml_num_fans = []
+            for handle in self._nvml_handles:
+                try:
+                    name = pynvml.nvmlDeviceGetName(handle)
+                    if isinstance(name, bytes):
+                        name = name.decode('utf-8')
+                except Exception:
+                    name = 'Unknown GPU'
+                self._nvml_names.append(name)
 
+                try:
+                    num_fans = pynvml.nvmlDeviceGetNumFans(handle)
+                except Exception:
+                    num_fans = 1
+                self._nvml_num_fans.append(num_fans)
+
+    def _shutdown_nvml(self):
+        """Shutdown NVIDIA Management Library."""
+        with self._nvml_lock:
+            if self._nvml_initialized:
+                try:
+                    pynvml.nvmlShutdown()
+                except Exception:
+                    pass
+                self._nvml_initialized = False
+                self._nvml_handles = []
+                self._nvml_names = []
+                self._nvml_num_fans = []
+
+    @ttl_cache(0.5)
     def get_cpu_stats(self) -> dict[str, Any]:
         """Get CPU statistics."""
         try:
-            cpu_percent = psutil.cpu_percent(interval=None)
+            # One per-core sample; the aggregate is their average
             cpu_per_core = psutil.cpu_percent(interval=None, percpu=True)
-            cpu_freq = psutil.cpu_freq()
+            cpu_percent = sum(cpu_per_core) / len(cpu_per_core) if cpu_per_core else 0.0
+            cpu_freq = self._get_cpu_frequency()
 
             # Try to get CPU temperature
             cpu_temp = self._get_cpu_temperature()
@@ -309,145 +567,183 @@ class HardwareMonitor:
             result = {
                 'usage': cpu_percent,
                 'per_core': cpu_per_core,
-                'frequency': cpu_freq.current if cpu_freq else None,
-                'frequency_max': cpu_freq.max if cpu_freq else None,
+                'frequency': cpu_freq,
                 'temperature': cpu_temp,
-                'cores': psutil.cpu_count(logical=False),
-                'threads': psutil.cpu_count(logical=True),
             }
 
-            # Add static hardware info
-            if self._cpu_hardware_info and self._cpu_hardware_info.get('available'):
-                result['name'] = self._cpu_hardware_info.get('name')
-                result['max_clock'] = self._cpu_hardware_info.get('max_clock')
-                result['l2_cache_kb'] = self._cpu_hardware_info.get('l2_cache_kb')
-                result['l3_cache_kb'] = self._cpu_hardware_info.get('l3_cache_kb')
-                result['socket'] = self._cpu_hardware_info.get('socket')
-
             return result
         except Exception as e:
             return {'error': str(e)}
 
-    def _get_cpu_temperature(self) -> float | None:
-        """Get CPU temperature using multiple methods."""
-        # Method 1: Try psutil (works on Linux)
+    @ttl_cache(2.0)
+    def _get_cpu_frequency(self) -> float | None:
+        """Get current CPU frequency in MHz."""
+        if self._cpu_freq_fd is not None:
+            try:
+                return int(os.pread(self._cpu_freq_fd, 32, 0)) / 1000  # kHz -> MHz
+            except (OSError, ValueError):
+                pass
+
         try:
-            temps = psutil.sensors_temperatures()
-            if temps:
-                for key in ['coretemp', 'cpu_thermal', 'k10temp', 'zenpower']:
-                    if key in temps and temps[key]:
-                        return temps[key][0].current
+            cpu_freq = psutil.cpu_freq()
         except Exception:
-            pass
+            return None
+        return cpu_freq.current if cpu_freq else None
 
-        # Method 2: Try WMI on Windows (MSAcpi_ThermalZoneTemperature)
-        if WMI_AVAILABLE:
+    def _get_cpu_temperature(self) -> float | None:
+        """Get CPU temperature, skipping methods that raised within the last 30s."""
+        now = time.monotonic()
+        for name in list(self._temp_methods):
+            if self._temp_failed_until.get(name, 0) > now:
+                continue
             try:
-                w = wmi.WMI(namespace="root\\wmi")
-                temperature_info = w.MSAcpi_ThermalZoneTemperature()
-                if temperature_info:
-                    # Temperature is in tenths of Kelvin, convert to Celsius
-                    temp_kelvin = temperature_info[0].CurrentTemperature / 10.0
-                    temp_celsius = temp_kelvin - 273.15
-                    if 0 < temp_celsius < 150:  # Sanity check
-                        return round(temp_celsius, 1)
+                temp = getattr(self, f'_cpu_temp_{name}')()
             except Exception:
-                pass
+                # Provider missing for now (e.g. LHM not started yet); retry after a cooldown
+                self._temp_failed_until[name] = now + 30.0
+                continue
+            self._temp_failed_until.pop(name, None)
+            if temp is not None:
+                # Try the working method first next time
+                if self._temp_methods[0] != name:
+                    self._temp_methods.remove(name)
+                    self._temp_methods.insert(0, name)
+                return temp
 
-            # Method 3: Try Open Hardware Monitor WMI interface (if installed)
-            try:
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        return round(sensor.Value, 1)
-            except Exception:
-                pass
+        return None
 
-            # Method 4: Try LibreHardwareMonitor WMI interface (if installed)
-            try:
-                w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        return round(sensor.Value, 1)
-            except Exception:
-                pass
+    def _cpu_temp_psutil(self) -> float | None:
+        """Read CPU temperature via psutil (works on Linux)."""
+        temps = psutil.sensors_temperatures()
+        if temps:
+            for key in ['coretemp', 'cpu_thermal', 'k10temp', 'zenpower']:
+                if key in temps and temps[key]:
+                    return temps[key][0].current
+        return None
+
+    def _cpu_temp_msacpi(self) -> float | None:
+        """Read CPU temperature via WMI (MSAcpi_ThermalZoneTemperature)."""
+        temperature_info = self._wmi_query("root\\wmi", lambda w: w.MSAcpi_ThermalZoneTemperature())
+        if temperature_info:
+            # Temperature is in tenths of Kelvin, convert to Celsius
+            temp_kelvin = temperature_info[0].CurrentTemperature / 10.0
+            temp_celsius = temp_kelvin - 273.15
+            if 0 < temp_celsius < 150:  # Sanity check
+                return round(temp_celsius, 1)
+        return None
 
+    def _cpu_temp_ohm(self) -> float | None:
+        """Read CPU temperature via Open Hardware Monitor WMI interface (if installed)."""
+        return self._cpu_temp_from_sensors("root\\OpenHardwareMonitor")
+
+    def _cpu_temp_lhm(self) -> float | None:
+        """Read CPU temperature via LibreHardwareMonitor WMI interface (if installed)."""
+        return self._cpu_temp_from_sensors("root\\LibreHardwareMonitor")
+
+    def _cpu_temp_from_sensors(self, namespace: str) -> float | None:
+        """Read the first CPU temperature sensor from a hardware monitor namespace."""
+        for sensor in self._wmi_query(namespace, lambda w: w.Sensor()):
+            if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
+                return round(sensor.Value, 1)
         return None
 
+    @ttl_cache(0.5)
     def get_gpu_stats(self) -> dict[str, Any]:
         """Get GPU statistics using pynvml."""
         if not self._nvml_initialized:
             return self._get_gpu_stats_fallback()
 
         try:
-            device_count = pynvml.nvmlDeviceGetCount()
-            if device_count == 0:
+            if not self._nvml_handles:
                 return {'available': False}
 
             # Get first GPU
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-
-            # Get name
-            name = pynvml.nvmlDeviceGetName(handle)
-            if isinstance(name, bytes):
-                name = name.decode('utf-8')
+            handle = self._nvml_handles[0]
 
-            # Get utilization
-            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+            with self._nvml_lock:
+                # Get utilization
+                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
 
-            # Get memory
-            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                # Get memory
+                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
 
-            # Get temperature
-            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+                # Get temperature
+                temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
 
-            # Get clock speeds
-            try:
-                graphics_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)
-                memory_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
-            except Exception:
-                graphics_clock = None
-                memory_clock = None
+                # Get clock speeds
+                try:
+                    graphics_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_GRAPHICS)
+                    memory_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
+                except Exception:
+                    graphics_clock = None
+                    memory_clock = None
 
-            # Get fan speed
-            try:
-                fan_speed = pynvml.nvmlDeviceGetFanSpeed(handle)
-            except Exception:
-                fan_speed = None
+                # Get fan speed
+                try:
+                    fan_speed = pynvml.nvmlDeviceGetFanSpeed(handle)
+                except Exception:
+                    fan_speed = None
 
-            # Get power
-            try:
-                power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # Convert to watts
-                power_limit = pynvml.nvmlDeviceGetPowerManagementLimit(handle) / 1000
-            except Exception:
-                power = None
-                power_limit = None
+                # Get power (batched field query, per-metric calls as fallback)
+                power, power_limit = self._get_gpu_power_fields(handle)
+                if power is None:
+                    try:
+                        power = pynvml.nvmlDeviceGetPowerUsage(handle) / 1000  # Convert to watts
+                    except Exception:
+                        pass
+                if power_limit is None:
+                    try:
+                        power_limit = pynvml.nvmlDeviceGetPowerManagementLimit(handle) / 1000
+                    except Exception:
+                        pass
 
-            return {
-                'available': True,
-                'name': name,
-                'usage': util.gpu,
-                'memory_used': mem.used / (1024 ** 3),  # GB
-                'memory_total': mem.total / (1024 ** 3),  # GB
-                'memory_percent': (mem.used / mem.total) * 100,
-                'temperature': temp,
-                'graphics_clock': graphics_clock,
-                'memory_clock': memory_clock,
-                'fan_speed': fan_speed,
-                'power': power,
-                'power_limit': power_limit,
-            }
+                return {
+                    'available': True,
+                    'usage': util.gpu,
+                    'memory_used': mem.used / (1024 ** 3),  # GB
+                    'memory_total': mem.total / (1024 ** 3),  # GB
+                    'memory_percent': (mem.used / mem.total) * 100,
+                    'temperature': temp,
+                    'graphics_clock': graphics_clock,
+                    'memory_clock': memory_clock,
+                    'fan_speed': fan_speed,
+                    'power': power,
+                    'power_limit': power_limit,
+                }
         except Exception as e:
             return self._get_gpu_stats_fallback()
 
+    def _get_gpu_power_fields(self, handle) -> tuple[float | None, float | None]:
+        """Read GPU power draw and limit (watts) with one nvmlDeviceGetFieldValues call."""
+        if not self._nvml_field_values_supported:
+            return None, None
+
+        try:
+            values = pynvml.nvmlDeviceGetFieldValues(handle, _NVML_POWER_FIELDS)
+        except Exception:
+            # Driver doesn't support field queries, stop trying
+            self._nvml_field_values_supported = False
+            return None, None
+
+        results = []
+        for field in values:
+            if field.nvmlReturn != pynvml.NVML_SUCCESS:
+                results.append(None)
+                continue
+            member = _NVML_VALUE_MEMBERS.get(field.valueType, 'uiVal')
+            results.append(getattr(field.value, member) / 1000)  # Convert to watts
+
+        if all(value is None for value in results):
+            self._nvml_field_values_supported = False
+        return results[0], results[1]
+
     def _get_gpu_stats_fallback(self) -> dict[str, Any]:
         """Fallback GPU stats using GPUtil."""
         if not GPUTIL_AVAILABLE:
             return {'available': False}
 
         try:
+            import GPUtil
             gpus = GPUtil.getGPUs()
             if not gpus:
                 return {'available': False}
@@ -470,224 +766,360 @@ class HardwareMonitor:
         except Exception:
             return {'available': False}
 
+    @ttl_cache(1.0)
     def get_memory_stats(self) -> dict[str, Any]:
         """Get RAM statistics."""
         try:
-            mem = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            mem = self._read_meminfo()
+            if mem is None:
+                vm = psutil.virtual_memory()
+                swap = psutil.swap_memory()
+                mem = {
+                    'total': vm.total,
+                    'available': vm.available,
+                    'used': vm.used,
+                    'percent': vm.percent,
+                    'cached': getattr(vm, 'cached', 0),
+                    'buffers': getattr(vm, 'buffers', 0),
+                    'swap_total': swap.total,
+                    'swap_used': swap.used,
+                    'swap_percent': swap.percent,
+                }
 
             result = {
-                'used': mem.used / (1024 ** 3),  # GB
-                'total': mem.total / (1024 ** 3),  # GB
-                'percent': mem.percent,
-                'available': mem.available / (1024 ** 3),  # GB
-                'cached': getattr(mem, 'cached', 0) / (1024 ** 3),  # GB (Linux)
-                'buffers': getattr(mem, 'buffers', 0) / (1024 ** 3),  # GB (Linux)
-                'swap_used': swap.used / (1024 ** 3),  # GB
-                'swap_total': swap.total / (1024 ** 3),  # GB
-                'swap_percent': swap.percent,
+                'used': mem['used'] / (1024 ** 3),  # GB
+                'total': mem['total'] / (1024 ** 3),  # GB
+                'percent': mem['percent'],
+                'available': mem['available'] / (1024 ** 3),  # GB
+                'cached': mem['cached'] / (1024 ** 3),  # GB (Linux)
+                'buffers': mem['buffers'] / (1024 ** 3),  # GB (Linux)
+                'swap_used': mem['swap_used'] / (1024 ** 3),  # GB
+                'swap_total': mem['swap_total'] / (1024 ** 3),  # GB
+                'swap_percent': mem['swap_percent'],
             }
 
-            # Add hardware info (speed, type, slots)
-            if self._memory_hardware_info and self._memory_hardware_info.get('available'):
-                result['speed'] = self._memory_hardware_info.get('speed')
-                result['type'] = self._memory_hardware_info.get('type')
-                result['slots_used'] = self._memory_hardware_info.get('slots_used')
-                result['slots_total'] = self._memory_hardware_info.get('slots_total')
-                result['modules'] = self._memory_hardware_info.get('modules')
-
             return result
         except Exception as e:
             return {'error': str(e)}
 
+    def _read_proc(self, path: str) -> bytes | None:
+        """Read a /proc file through its persistent descriptor (None if unavailable)."""
+        fd = self._proc_fds.get(path)
+        if fd is None:
+            return None
+        try:
+            chunks = []
+            offset = 0
+            while True:
+                chunk = os.pread(fd, 65536, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+            return b''.join(chunks)
+        except OSError:
+            return None
+
+    def _read_meminfo(self) -> dict[str, Any] | None:
+        """Memory and swap figures (bytes) from one /proc/meminfo read, computed as psutil does."""
+        data = self._read_proc(PROC_MEMINFO_PATH)
+        if not data:
+            return None
+        try:
+            fields = {}
+            for line in data.splitlines():
+                key, _, value = line.partition(b':')
+                fields[key] = int(value.split()[0]) * 1024  # kB -> bytes
+            total = fields[b'MemTotal']
+            free = fields[b'MemFree']
+            buffers = fields.get(b'Buffers', 0)
+            cached = fields.get(b'Cached', 0) + fields.get(b'SReclaimable', 0)
+            available = fields.get(b'MemAvailable', free + buffers + cached)
+            used = total - free - buffers - cached
+            if used < 0:
+                used = total - free
+            swap_total = fields.get(b'SwapTotal', 0)
+            swap_used = swap_total - fields.get(b'SwapFree', 0)
+        except (KeyError, ValueError, IndexError):
+            return None
+
+        return {
+            'total': total,
+            'available': available,
+            'used': used,
+            'percent': round((total - available) / total * 100, 1) if total else 0.0,
+            'cached': cached,
+            'buffers': buffers,
+            'swap_total': swap_total,
+            'swap_used': swap_used,
+            'swap_percent': round(swap_used / swap_total * 100, 1) if swap_total else 0.0,
+        }
+
     def get_disk_stats(self) -> dict[str, Any]:
-        """Get disk I/O statistics."""
+        """Get disk I/O statistics with read/write rates since the previous call."""
         try:
-            disk_io = psutil.disk_io_counters()
+            counters = psutil.disk_io_counters(nowrap=True)
+            disk_io = counters._asdict() if counters else None
             if disk_io:
-                return {
-                    'read_bytes': disk_io.read_bytes,
-                    'write_bytes': disk_io.write_bytes,
-                    'read_count': disk_io.read_count,
-                    'write_count': disk_io.write_count,
+                now = time.monotonic_ns()
+                result = {
+                    'read_bytes': disk_io['read_bytes'],
+                    'write_bytes': disk_io['write_bytes'],
+                    'read_count': disk_io['read_count'],
+                    'write_count': disk_io['write_count'],
                 }
+
+                # Calculate rates from the previous sample
+                if self._disk_last:
+                    last_read, last_write, last_time = self._disk_last
+                    elapsed_ns = now - last_time
+                    if elapsed_ns > 0:
+                        # Integer byte deltas, one float scale to MB/s (2 decimals is plenty for display)
+                        scale = 1_000_000_000 * _INV_MIB / elapsed_ns
+                        # Totals drop when a device disappears; never report negative rates
+                        result['read_rate'] = round(max(disk_io['read_bytes'] - last_read, 0) * scale, 2)
+                        result['write_rate'] = round(max(disk_io['write_bytes'] - last_write, 0) * scale, 2)
+
+                self._disk_last = (disk_io['read_bytes'], disk_io['write_bytes'], now)
+                return result
             return {'available': False}
         except Exception as e:
             return {'error': str(e)}
 
     def get_network_stats(self) -> dict[str, Any]:
-        """Get network I/O statistics."""
+        """Get network I/O statistics with upload/download rates since the previous call."""
         try:
-            net_io = psutil.net_io_counters()
+            net_io = psutil.net_io_counters(nowrap=True)._asdict()
+            now = time.monotonic_ns()
 
             # Calculate packet loss percentage
-            total_packets = net_io.packets_sent + net_io.packets_recv
-            total_errors = net_io.errin + net_io.errout + net_io.dropin + net_io.dropout
+            total_packets = net_io['packets_sent'] + net_io['packets_recv']
+            total_errors = net_io['errin'] + net_io['errout'] + net_io['dropin'] + net_io['dropout']
             packet_loss = (total_errors / total_packets * 100) if total_packets > 0 else 0
 
-            return {
-                'bytes_sent': net_io.bytes_sent,
-                'bytes_recv': net_io.bytes_recv,
-                'packets_sent': net_io.packets_sent,
-                'packets_recv': net_io.packets_recv,
-                'packets_dropped': net_io.dropin + net_io.dropout,
-                'packets_errors': net_io.errin + net_io.errout,
+            result = {
+                'bytes_sent': net_io['bytes_sent'],
+                'bytes_recv': net_io['bytes_recv'],
+                'packets_sent': net_io['packets_sent'],
+                'packets_recv': net_io['packets_recv'],
+                'packets_dropped': net_io['dropin'] + net_io['dropout'],
+                'packets_errors': net_io['errin'] + net_io['errout'],
                 'packet_loss': packet_loss,
             }
+
+            # Calculate rates from the previous sample
+            if self._net_last:
+                last_sent, last_recv, last_time = self._net_last
+                elapsed_ns = now - last_time
+                if elapsed_ns > 0:
+                    # Integer byte deltas, one float scale to MB/s (2 decimals is plenty for display)
+                    scale = 1_000_000_000 * _INV_MIB / elapsed_ns
+                    # Totals drop when an interface goes away (VPN, USB NIC); never report negative rates
+                    result['upload_rate'] = round(max(net_io['bytes_sent'] - last_sent, 0) * scale, 2)
+                    result['download_rate'] = round(max(net_io['bytes_recv'] - last_recv, 0) * scale, 2)
+
+            self._net_last = (net_io['bytes_sent'], net_io['bytes_recv'], now)
+            return result
         except Exception as e:
             return {'error': str(e)}
 
-    def get_ping(self, host: str = "8.8.8.8") -> dict[str, Any]:
-        """Measure network latency (ping) to a host."""
+    async def get_ping_async(self, host: str = "8.8.8.8") -> dict[str, Any]:
+        """Measure network latency asynchronously, reusing recent results."""
+        # Check cache first
+        current_time = time.time()
+        if (self._ping_cache and self._ping_cache['host'] == host
+                and (current_time - self._ping_cache_time) < self._ping_cache_ttl):
+            return self._ping_cache
+
+        # Prefer an in-process ICMP echo, then a TCP connect probe, then the ping command
+        result = None
+        if ICMPLIB_AVAILABLE and self._icmp_supported:
+            result = await self._ping_icmp(host)
+        if result is None:
+            result = await self._ping_tcp(host)
+        if result is None:
+            result = await self._ping_subprocess(host)
+
+        # Update cache
+        self._ping_cache = result
+        self._ping_cache_time = time.time()
+
+        return result
+
+    async def _ping_icmp(self, host: str) -> dict[str, Any] | None:
+        """Ping a host with an ICMP echo socket (no subprocess)."""
         try:
-            # Use Windows ping command
-            result = subprocess.run(
-                ["ping", "-n", "1", "-w", "1000", host],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
+            reply = await icmplib.async_ping(host, count=1, timeout=1, privileged=False)
+        except icmplib.SocketPermissionError:
+            # ICMP sockets not permitted for this user, stop trying
+            self._icmp_supported = False
+            return None
+        except Exception as e:
+            return {'ping': None, 'host': host, 'success': False, 'error': str(e)}
+
+        if reply.is_alive:
+            return {'ping': round(reply.avg_rtt), 'host': host, 'success': True}
+        return {'ping': None, 'host': host, 'success': False, 'error': 'timeout'}
+
+    async def _ping_tcp(self, host: str, port: int = 53) -> dict[str, Any] | None:
+        """Estimate latency from the time to open a TCP connection (one round trip)."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
+        except asyncio.TimeoutError:
+            return {'ping': None, 'host': host, 'success': False, 'error': 'timeout'}
+        except OSError:
+            # Port closed or unreachable, let the ping command try
+            return None
+
+        rtt = loop.time() - start
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+        return {'ping': round(rtt * 1000), 'host': host, 'success': True}
 
-            if result.returncode == 0:
-                # Parse ping time from output (Windows format: "time=XXms" or "time<1ms")
-                output = result.stdout
-                match = re.search(r'time[=<](\d+)ms', output, re.IGNORECASE)
+    async def _ping_subprocess(self, host: str) -> dict[str, Any]:
+        """Ping a host with the system ping command."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "ping", "-n", "1", "-w", "1000", host,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2.0)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()  # Reap it so no zombie/transport is left behind
+                raise
+
+            if proc.returncode == 0:
+                match = _PING_RE.search(stdout)
                 if match:
-                    ping_ms = int(match.group(1))
-                    return {'ping': ping_ms, 'host': host, 'success': True}
+                    return {'ping': int(match.group(1)), 'host': host, 'success': True}
 
             return {'ping': None, 'host': host, 'success': False}
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {'ping': None, 'host': host, 'success': False, 'error': 'timeout'}
         except Exception as e:
             return {'ping': None, 'host': host, 'success': False, 'error': str(e)}
 
+    @ttl_cache(2.0)  # Process list changes slowly
     def get_top_processes(self, limit: int = 8) -> list[dict[str, Any]]:
         """Get top processes by CPU and memory usage."""
         try:
-            num_cpus = psutil.cpu_count(logical=True) or 1
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            num_cpus = self._cpu_threads or 1
+
+            # Keep Process objects across calls (needed for cpu_percent deltas)
+            current_pids = set(psutil.pids())
+            for pid in self._proc_cache.keys() - current_pids:
+                del self._proc_cache[pid]
+            for pid in current_pids - self._proc_cache.keys():
                 try:
-                    info = proc.info
-                    # Normalize CPU percent so total across all processes <= 100%
-                    # psutil reports per-core %, so divide by number of logical CPUs
-                    cpu_normalized = (info['cpu_percent'] or 0) / num_cpus
-                    processes.append({
-                        'pid': info['pid'],
-                        'name': info['name'],
-                        'cpu_percent': cpu_normalized,
-                        'memory_percent': info['memory_percent'] or 0,
-                    })
+                    self._proc_cache[pid] = psutil.Process(pid)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            return processes[:limit]
+            processes = []
+            warm = self._proc_warm
+            for pid, proc in list(self._proc_cache.items()):
+                try:
+                    # as_dict() batches the reads with oneshot()
+                    info = proc.as_dict(['name', 'cpu_percent', 'memory_percent'])
+                except psutil.NoSuchProcess:
+                    self._proc_cache.pop(pid, None)
+                    continue
+                except psutil.AccessDenied:
+                    continue
+
+                # Normalize CPU percent so total across all processes <= 100%
+                # psutil reports per-core %, so divide by number of logical CPUs
+                cpu_normalized = (info['cpu_percent'] or 0) / num_cpus
+                memory_percent = info['memory_percent'] or 0
+
+                # Idle, small processes can't make the list (once CPU samples are warm)
+                if warm and cpu_normalized == 0 and memory_percent < 0.5:
+                    continue
+
+                processes.append({
+                    'pid': pid,
+                    'name': info['name'],
+                    'cpu_percent': cpu_normalized,
+                    'memory_percent': memory_percent,
+                })
+
+            # First cpu_percent() call per process always reads 0.0
+            self._proc_warm = True
+
+            # Top processes by CPU usage (partial sort)
+            return heapq.nlargest(limit, processes, key=lambda x: x['cpu_percent'])
         except Exception as e:
             return []
 
+    def _read_fan_sensors(self, namespace: str) -> list[dict[str, Any]]:
+        """Read fan RPM and control values from a hardware monitor WMI namespace."""
+        fan_rpms = []  # (name, rpm) in sensor order
+        fan_controls = {}  # Map fan name to control percentage
+
+        # Single query: only fan RPM and control (percentage) rows cross COM
+        for sensor in self._wmi_query(namespace, lambda w: w.query(_FAN_SENSOR_WQL)):
+            sensor_type = sensor.SensorType
+            name = sensor.Name
+            # Skip pump fans (they always run at 100%)
+            if name == 'Pump Fan':
+                continue
+
+            value = int(sensor.Value) if sensor.Value else 0
+            if sensor_type == 'Control':
+                fan_controls[name] = value
+            else:
+                fan_rpms.append((name, value))
+
+        # Match fan RPM with controls
+        return [
+            {
+                'name': name,
+                'percent': fan_controls.get(name),
+                'rpm': rpm,
+                'type': 'gpu' if 'GPU' in name else 'system'
+            }
+            for name, rpm in fan_rpms
+        ]
+
+    @ttl_cache(1.5)  # WMI queries are expensive
     def get_fan_stats(self) -> dict[str, Any]:
         """Get fan speed statistics with caching to reduce WMI overhead."""
-        # Check cache first
-        current_time = time.time()
-        if self._fan_cache and (current_time - self._fan_cache_time) < self._fan_cache_ttl:
-            return self._fan_cache
-
         fans = []
-        fan_controls = {}  # Map fan name to control percentage
         lhm_available = False
 
-        # Try LibreHardwareMonitor first (best data source)
+        # Try LibreHardwareMonitor first (best data source), then OpenHardwareMonitor,
+        # starting with whichever namespace answered last time
         if WMI_AVAILABLE:
-            try:
-                lhm = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-
-                # First pass: collect control (percentage) values
-                for sensor in lhm.Sensor():
-                    if sensor.SensorType == 'Control':
-                        name = sensor.Name
-                        # Skip pump fans (they always run at 100%)
-                        if name == 'Pump Fan':
-                            continue
-                        percent = int(sensor.Value) if sensor.Value else 0
-                        fan_controls[name] = percent
-
-                # Second pass: collect fan RPM and match with controls
-                for sensor in lhm.Sensor():
-                    if sensor.SensorType == 'Fan':
-                        name = sensor.Name
-
-                        # Skip pump fans (they always run at 100%)
-                        if name == 'Pump Fan':
-                            continue
-
-                        rpm = int(sensor.Value) if sensor.Value else 0
-                        fan_type = 'gpu' if 'GPU' in name else 'system'
-                        percent = fan_controls.get(name)
-
-                        fans.append({
-                            'name': name,
-                            'percent': percent,
-                            'rpm': rpm,
-                            'type': fan_type
-                        })
-                        lhm_available = True
-            except Exception:
-                pass
+            namespaces = ["root\\LibreHardwareMonitor", "root\\OpenHardwareMonitor"]
+            if self._fan_namespace in namespaces:
+                namespaces.remove(self._fan_namespace)
+                namespaces.insert(0, self._fan_namespace)
 
-            # Try OpenHardwareMonitor if LHM not available
-            if not lhm_available:
+            for namespace in namespaces:
                 try:
-                    ohm = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-
-                    # First pass: collect control values
-                    for sensor in ohm.Sensor():
-                        if sensor.SensorType == 'Control':
-                            name = sensor.Name
-                            # Skip pump fans (they always run at 100%)
-                            if name == 'Pump Fan':
-                                continue
-                            percent = int(sensor.Value) if sensor.Value else 0
-                            fan_controls[name] = percent
-
-                    # Second pass: collect fan RPM
-                    for sensor in ohm.Sensor():
-                        if sensor.SensorType == 'Fan':
-                            name = sensor.Name
-
-                            # Skip pump fans (they always run at 100%)
-                            if name == 'Pump Fan':
-                                continue
-
-                            rpm = int(sensor.Value) if sensor.Value else 0
-                            fan_type = 'gpu' if 'GPU' in name else 'system'
-                            percent = fan_controls.get(name)
-
-                            fans.append({
-                                'name': name,
-                                'percent': percent,
-                                'rpm': rpm,
-                                'type': fan_type
-                            })
-                            lhm_available = True
+                    fans = self._read_fan_sensors(namespace)
                 except Exception:
-                    pass
+                    fans = []
+                if fans:
+                    self._fan_namespace = namespace
+                    lhm_available = True
+                    break
 
         # If no hardware monitor available, fall back to NVML for GPU fans
         if not lhm_available and self._nvml_initialized:
             try:
-                device_count = pynvml.nvmlDeviceGetCount()
-                for i in range(device_count):
-                    handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                    try:
-                        num_fans = 1
-                        try:
-                            num_fans = pynvml.nvmlDeviceGetNumFans(handle)
-                        except Exception:
-                            pass
-
+                with self._nvml_lock:
+                    for handle, num_fans in zip(self._nvml_handles, self._nvml_num_fans):
                         for fan_idx in range(num_fans):
                             try:
                                 speed_percent = pynvml.nvmlDeviceGetFanSpeed_v2(handle, fan_idx)
@@ -709,8 +1141,6 @@ class HardwareMonitor:
                                 except Exception:
                                     pass
                                 break
-                    except Exception:
-                        pass
             except Exception:
                 pass
 
@@ -744,27 +1174,22 @@ class HardwareMonitor:
 
         fans.sort(key=sort_key)
 
-        result = {
+        return {
             'fans': fans,
             'count': len(fans)
         }
 
-        # Update cache
-        self._fan_cache = result
-        self._fan_cache_time = current_time
-
-        return result
-
     def get_system_info(self) -> dict[str, Any]:
-        """Get system hardware information (mostly static, cached at startup)."""
+        """Get live system info (uptime); the rest is in get_static_stats()."""
         if not self._system_hardware_info or not self._system_hardware_info.get('available'):
             return {'available': False}
 
-        result = dict(self._system_hardware_info)
+        result = {'available': True}
 
         # Add real-time uptime calculation
-        if result.get('boot_time'):
-            uptime_seconds = int(time.time() - result['boot_time'])
+        boot_time = self._system_hardware_info.get('boot_time')
+        if boot_time:
+            uptime_seconds = int(time.time() - boot_time)
             days = uptime_seconds // 86400
             hours = (uptime_seconds % 86400) // 3600
             minutes = (uptime_seconds % 3600) // 60
@@ -778,21 +1203,104 @@ class HardwareMonitor:
 
         return result
 
+    def get_static_stats(self) -> dict[str, Any]:
+        """Get fields that never change while running (names, clocks, caches, modules, slots)."""
+        static = {
+            'cpu': {
+                **self._cpu_static,
+                'frequency_max': self._cpu_freq_max,
+                'cores': self._cpu_cores,
+                'threads': self._cpu_threads,
+            },
+            'memory': dict(self._memory_static),
+        }
+        if self._nvml_names:
+            static['gpu'] = {'name': self._nvml_names[0]}
+        if self._system_hardware_info and self._system_hardware_info.get('available'):
+            static['system'] = dict(self._system_hardware_info)
+        return static
+
     def get_all_stats(self) -> dict[str, Any]:
-        """Get all hardware statistics (ping handled async in server)."""
-        return {
-            'cpu': self.get_cpu_stats(),
-            'gpu': self.get_gpu_stats(),
-            'memory': self.get_memory_stats(),
-            'disk': self.get_disk_stats(),
-            'network': self.get_network_stats(),
-            'fans': self.get_fan_stats(),
-            'processes': self.get_top_processes(),
-            'system': self.get_system_info(),
+        """Get all hardware statistics, static fields included (ping handled async in server)."""
+        stats = self.get_dynamic_stats()
+        for key, fields in self.get_static_stats().items():
+            section = stats.get(key)
+            if isinstance(section, dict):
+                stats[key] = {**fields, **section}
+        return stats
+
+    def get_dynamic_stats(self) -> dict[str, Any]:
+        """Get only the fields that change between ticks.
+
+        Callers within the snapshot TTL share one collection; only one thread
+        collects at a time.
+        """
+        with self._snapshot_lock:
+            if (self._snapshot is not None
+                    and (time.monotonic() - self._snapshot_time) < self._snapshot_ttl):
+                return dict(self._snapshot)
+
+            stats = self._collect_all_stats()
+            self._snapshot = stats
+            self._snapshot_time = time.monotonic()
+            return dict(stats)
+
+    def _collect_all_stats(self) -> dict[str, Any]:
+        """Run all collectors concurrently and assemble a snapshot."""
+        collectors = {
+            'cpu': self.get_cpu_stats,
+            'gpu': self.get_gpu_stats,
+            'memory': self.get_memory_stats,
+            'disk': self.get_disk_stats,
+            'network': self.get_network_stats,
+            'fans': self.get_fan_stats,
+            'processes': self.get_top_processes,
+            'system': self.get_system_info,
         }
+        futures = {}
+        for key, fn in collectors.items():
+            previous = self._collector_futures.get(key)
+            if previous is not None and not previous.done():
+                # Timed out last snapshot and still running; overlapping it would race
+                # on its unlocked state (_disk_last, _net_last, _temp_methods, TTL caches)
+                futures[key] = previous
+            else:
+                futures[key] = self._collector_futures[key] = self._pool.submit(fn)
 
-    def __del__(self):
+        # Bound the whole snapshot so one slow WMI call can't stall it
+        deadline = time.monotonic() + 2.0
+        stats = {}
+        for key, future in futures.items():
+            try:
+                stats[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                stats[key] = [] if key == 'processes' else {'error': str(e) or 'timeout'}
+
+        return stats
+
+    def shutdown(self):
+        """Release collector threads and NVML (call explicitly, not from __del__)."""
+        # Wait out any snapshot in progress, then any collector still running from
+        # an abandoned one, so nothing touches NVML or the fds after they're closed
+        with self._snapshot_lock:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._release_resources()
+
+    def _release_resources(self):
+        """Shut down NVML and close the persistent file descriptors."""
         self._shutdown_nvml()
+        if self._cpu_freq_fd is not None:
+            try:
+                os.close(self._cpu_freq_fd)
+            except OSError:
+                pass
+            self._cpu_freq_fd = None
+        for fd in self._proc_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._proc_fds.clear()
 
 
 # Global instance
@@ -803,8 +1311,18 @@ def get_monitor() -> HardwareMonitor:
     global _monitor
     if _monitor is None:
         _monitor = HardwareMonitor()
+        atexit.register(_monitor.shutdown)
     return _monitor
 
+def shutdown_monitor():
+    """Shut down the global hardware monitor instance, if one was created."""
+    if _monitor is not None:
+        _monitor.shutdown()
+
 def get_all_stats() -> dict[str, Any]:
     """Convenience function to get all stats."""
     return get_monitor().get_all_stats()
+
+def get_dynamic_stats() -> dict[str, Any]:
+    """Convenience function to get the per-tick stats without static fields."""
+    return get_monitor().get_dynamic_stats()
@@ -1,179 +1,297 @@
 """FastAPI web server with WebSocket support for real-time stats."""
 
 import asyncio
-import json
-import re
+import functools
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Set
+from typing import List, Tuple
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, status
+import msgpack
+import orjson
+from fastapi import FastAPI, Request, Response, WebSocket, status
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse
 
-from .hardware import get_all_stats
+from .hardware import (
+    get_all_stats, get_dynamic_stats, get_monitor, init_worker_thread, shutdown_monitor,
+)
+
+log = logging.getLogger(__name__)
 
 # Path to static files
 STATIC_DIR = Path(__file__).parent.parent / "static"
 
-# Connected WebSocket clients
-connected_clients: Set[WebSocket] = set()
+# Dashboard page, read once at startup and served from memory
+_index_html = b""
+_index_etag = ""
+
+# Connected WebSocket clients as (socket, outgoing frame queue, wants JSON)
+# (a plain list: with at most MAX_CONNECTIONS entries a scan beats hashing)
+connected_clients: List[Tuple[WebSocket, asyncio.Queue, bool]] = []
+
+# Set while at least one client is connected; background loops idle on it otherwise
+_has_clients = asyncio.Event()
+
+# Frames buffered per client before the oldest is dropped. One means ticks
+# coalesce: while a send is in flight, only the newest frame waits behind it.
+CLIENT_QUEUE_SIZE = 1
 
 # Connection rate limiting
 MAX_CONNECTIONS = 10
+_client_slots = asyncio.Semaphore(MAX_CONNECTIONS)
 
 # Background task for broadcasting stats
 broadcast_task = None
 
+# Background task for measuring ping, on its own slower cadence
+ping_task = None
 
-async def async_ping(host: str = "8.8.8.8") -> dict:
-    """Measure network latency asynchronously."""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "ping", "-n", "1", "-w", "1000", host,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2.0)
-
-        if proc.returncode == 0:
-            output = stdout.decode('utf-8', errors='ignore')
-            match = re.search(r'time[=<](\d+)ms', output, re.IGNORECASE)
-            if match:
-                return {'ping': int(match.group(1)), 'host': host, 'success': True}
-
-        return {'ping': None, 'host': host, 'success': False}
-    except asyncio.TimeoutError:
-        return {'ping': None, 'host': host, 'success': False, 'error': 'timeout'}
-    except Exception as e:
-        return {'ping': None, 'host': host, 'success': False, 'error': str(e)}
+# Most recent ping result, read by every broadcast tick
+latest_ping = {'ping': None, 'host': '8.8.8.8', 'success': False}
+
+# Stats collection runs off the event loop, one collection at a time (WMI isn't re-entrant)
+_stats_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="stats",
+    initializer=init_worker_thread,  # The monitor is built and queried here, so COM is needed
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
-    global broadcast_task
+    global broadcast_task, ping_task, _index_html, _index_etag
     # Startup
+    _index_html = (STATIC_DIR / "index.html").read_bytes()
+    _index_etag = f'"{hashlib.md5(_index_html).hexdigest()}"'
+    # Build the monitor (WMI/NVML init) off the event loop, before any client needs it
+    await asyncio.get_running_loop().run_in_executor(_stats_executor, get_monitor)
     broadcast_task = asyncio.create_task(broadcast_stats())
+    ping_task = asyncio.create_task(_ping_loop())
     yield
     # Shutdown
-    if broadcast_task:
-        broadcast_task.cancel()
-        try:
-            await broadcast_task
-        except asyncio.CancelledError:
-            pass
+    for task in (broadcast_task, ping_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    # A collection may still be running on the executor; let it finish before
+    # the monitor releases its pool, NVML and file descriptors
+    await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(_stats_executor.shutdown, wait=True)
+    )
+    shutdown_monitor()
+
 
+app = FastAPI(title="PC Monitor", lifespan=lifespan, default_response_class=ORJSONResponse)
 
-app = FastAPI(title="PC Monitor", lifespan=lifespan)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (list, weak W/ tags or *) against an ETag."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
 
 
 @app.get("/")
-async def get_dashboard():
-    """Serve the main dashboard."""
-    return FileResponse(STATIC_DIR / "index.html")
+async def get_dashboard(request: Request):
+    """Serve the main dashboard from memory, answering revalidations with 304."""
+    headers = {"ETag": _index_etag, "Cache-Control": "public, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match", ""), _index_etag):
+        return Response(status_code=304, headers=headers)
+    return Response(_index_html, media_type="text/html", headers=headers)
 
 
 @app.get("/api/stats")
 async def get_stats():
     """Get current hardware stats (REST endpoint)."""
-    return get_all_stats()
+    loop = asyncio.get_running_loop()
+    ping, stats = await asyncio.gather(
+        get_monitor().get_ping_async(),
+        loop.run_in_executor(_stats_executor, get_all_stats),
+    )
+    # Same flat ping fields as the WebSocket feed
+    stats['ping_ms'] = ping['ping']
+    stats['ping_ok'] = bool(ping['success'])
+    return stats
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time stats with connection limiting."""
-    # Rate limiting: reject if too many connections
-    if len(connected_clients) >= MAX_CONNECTIONS:
+    # Rate limiting: reserve a slot before accepting. Checking and acquiring
+    # don't yield in between, so concurrent connects can't overshoot the limit.
+    if _client_slots.locked():
         await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
         return
 
+    await _client_slots.acquire()
+    try:
+        await _serve_client(websocket)
+    finally:
+        _client_slots.release()
+
+
+async def _serve_client(websocket: WebSocket):
+    """Accept a client, send it the static stats, and stream broadcasts until it leaves."""
     await websocket.accept()
-    connected_clients.add(websocket)
+
+    # MessagePack by default; clients without a decoder loaded ask for JSON text frames
+    use_json = websocket.query_params.get('format') == 'json'
+
+    # Static fields go out once; broadcast ticks only carry what changes
+    init = {'type': 'init', 'data': get_monitor().get_static_stats()}
+    try:
+        await websocket.send(_encode_frame(init, use_json))
+    except Exception:
+        return
+
+    # A dedicated writer per client, so a slow client only delays its own frames
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    client = (websocket, queue, use_json)
+    connected_clients.append(client)
+    _has_clients.set()
+    writer = asyncio.create_task(_client_writer(client))
 
     try:
         while True:
-            # Keep connection alive, listen for messages
-            try:
-                await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-    except WebSocketDisconnect:
+            # Wait for the client to go away; incoming messages are ignored
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+    except RuntimeError:
+        # The writer already closed this socket
         pass
     finally:
-        connected_clients.discard(websocket)
+        _unregister(client)
+        writer.cancel()
+        try:
+            await writer
+        except asyncio.CancelledError:
+            pass
+
+
+def _encode_frame(data: dict, use_json: bool) -> dict:
+    """Encode data as a raw ASGI websocket.send message (MessagePack bytes or JSON text)."""
+    if use_json:
+        try:
+            text = orjson.dumps(data).decode()
+        except orjson.JSONEncodeError:
+            # A collector leaked a non-primitive value; stringify it
+            text = orjson.dumps(data, default=str).decode()
+        return {'type': 'websocket.send', 'text': text}
+    try:
+        message = msgpack.packb(data)
+    except TypeError:
+        # A collector leaked a non-primitive value; stringify it
+        message = msgpack.packb(data, default=str)
+    return {'type': 'websocket.send', 'bytes': message}
+
+
+async def _safe_send(websocket: WebSocket, frame: dict) -> bool:
+    """Send one ASGI websocket.send message; False if it failed or stalled past the timeout."""
+    try:
+        await asyncio.wait_for(websocket.send(frame), timeout=2.0)
+        return True
+    except Exception:
+        return False
+
+
+def _unregister(client: Tuple[WebSocket, asyncio.Queue, bool]):
+    """Remove a client from the broadcast list if it's still there."""
+    try:
+        connected_clients.remove(client)
+    except ValueError:
+        pass
+    if not connected_clients:
+        _has_clients.clear()
+
+
+async def _client_writer(client: Tuple[WebSocket, asyncio.Queue, bool]):
+    """Send queued frames to one client until a send fails or stalls."""
+    websocket, queue, _ = client
+    while True:
+        frame = await queue.get()
+        if not await _safe_send(websocket, frame):
+            break
+
+    # Stop queueing for this client and close it; the endpoint cleans up on disconnect
+    _unregister(client)
+    try:
+        await websocket.close()
+    except Exception:
+        pass
+
+
+async def _ping_loop():
+    """Background task to refresh latest_ping every 2s, off the stats tick."""
+    global latest_ping
+    while True:
+        try:
+            # Nobody is listening, don't ping
+            await _has_clients.wait()
+            latest_ping = await get_monitor().get_ping_async()
+            await asyncio.sleep(2.0)
+
+        except asyncio.CancelledError:
+            raise  # Re-raise to allow clean shutdown
+        except Exception as e:
+            log.warning("_ping_loop error: %s", e)
+            await asyncio.sleep(2.0)
 
 
 async def broadcast_stats():
     """Background task to broadcast stats to all connected clients."""
-    # Track previous values for rate calculations
-    prev_disk = None
-    prev_network = None
-    prev_time = None
+    loop = asyncio.get_running_loop()
 
     while True:
         try:
-            # Get hardware stats (sync) and ping (async) concurrently
-            stats = get_all_stats()
-
-            # Replace sync ping with async ping
-            ping_task = asyncio.create_task(async_ping())
-
-            current_time = asyncio.get_event_loop().time()
-
-            # Calculate disk rates
-            if prev_disk and prev_time:
-                time_delta = current_time - prev_time
-                if time_delta > 0 and 'read_bytes' in stats['disk']:
-                    read_rate = (stats['disk']['read_bytes'] - prev_disk['read_bytes']) / time_delta
-                    write_rate = (stats['disk']['write_bytes'] - prev_disk['write_bytes']) / time_delta
-                    stats['disk']['read_rate'] = read_rate / (1024 * 1024)  # MB/s
-                    stats['disk']['write_rate'] = write_rate / (1024 * 1024)  # MB/s
-
-            # Calculate network rates
-            if prev_network and prev_time:
-                time_delta = current_time - prev_time
-                if time_delta > 0 and 'bytes_sent' in stats['network']:
-                    upload_rate = (stats['network']['bytes_sent'] - prev_network['bytes_sent']) / time_delta
-                    download_rate = (stats['network']['bytes_recv'] - prev_network['bytes_recv']) / time_delta
-                    stats['network']['upload_rate'] = upload_rate / (1024 * 1024)  # MB/s
-                    stats['network']['download_rate'] = download_rate / (1024 * 1024)  # MB/s
-
-            # Store current values for next iteration
-            prev_disk = stats['disk'].copy() if 'read_bytes' in stats.get('disk', {}) else None
-            prev_network = stats['network'].copy() if 'bytes_sent' in stats.get('network', {}) else None
-            prev_time = current_time
-
-            # Wait for async ping result
-            stats['ping'] = await ping_task
+            # Nobody is listening, sleep until someone connects
+            await _has_clients.wait()
+
+            # Get hardware stats in a worker thread; ping comes from _ping_loop
+            stats = await loop.run_in_executor(_stats_executor, get_dynamic_stats)
+            # Flat primitives keep the encoder on its fast path
+            stats['ping_ms'] = latest_ping['ping']
+            stats['ping_ok'] = bool(latest_ping['success'])
 
             # Broadcast to all connected clients
             if connected_clients:
-                # Safely serialize to JSON with error handling
+                # Encode once per format; each raw ASGI message is shared by every
+                # client using that format (servers don't mutate it)
+                frames = {}
                 try:
-                    message = json.dumps(stats, default=str)
-                except (TypeError, ValueError) as json_err:
-                    print(f"JSON serialization error: {json_err}")
+                    for use_json in {use_json for _, _, use_json in connected_clients}:
+                        frames[use_json] = _encode_frame(stats, use_json)
+                except (TypeError, ValueError) as pack_err:
+                    log.warning("Stats serialization error: %s", pack_err)
                     await asyncio.sleep(0.5)
                     continue
 
-                disconnected = set()
-
-                for client in connected_clients:
-                    try:
-                        await client.send_text(message)
-                    except Exception:
-                        disconnected.add(client)
-
-                # Remove disconnected clients
-                connected_clients.difference_update(disconnected)
+                # Hand the frame to each client's writer without waiting on sends
+                # (nothing awaits inside the loop, so the list can't change under it)
+                for _, queue, use_json in connected_clients:
+                    frame = frames[use_json]
+                    if queue.full():
+                        # Previous frame not picked up yet, replace it with this one
+                        queue.get_nowait()
+                    queue.put_nowait(frame)
 
             await asyncio.sleep(0.5)  # Update every 500ms
 
         except asyncio.CancelledError:
             raise  # Re-raise to allow clean shutdown
         except Exception as e:
-            print(f"Error in broadcast_stats: {e}")
+            log.warning("broadcast_stats error: %s", e)
             await asyncio.sleep(1)
 
 
@@ -6,6 +6,7 @@ class PCMonitor {
         this.charts = {};
         this.maxHistoryLength = 60;
         this.totalMemoryGB = 0;
+        this.staticStats = {};
         this.init();
     }
 
@@ -16,9 +17,12 @@ class PCMonitor {
 
     connect() {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-        const wsUrl = `${protocol}//${window.location.host}/ws`;
+        // Fall back to JSON frames if the MessagePack decoder couldn't be loaded (offline, CDN blocked)
+        const format = typeof MessagePack === 'undefined' ? '?format=json' : '';
+        const wsUrl = `${protocol}//${window.location.host}/ws${format}`;
 
         this.ws = new WebSocket(wsUrl);
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
             this.updateConnectionStatus(true);
@@ -35,14 +39,32 @@ class PCMonitor {
 
         this.ws.onmessage = (event) => {
             try {
-                const data = JSON.parse(event.data);
-                this.updateDashboard(data);
+                // Stats frames are MessagePack-encoded binary, or JSON text in fallback mode
+                const data = typeof event.data === 'string'
+                    ? JSON.parse(event.data)
+                    : MessagePack.decode(event.data);
+                if (data.type === 'init') {
+                    // Static fields arrive once per connection
+                    this.staticStats = data.data || {};
+                    return;
+                }
+                this.updateDashboard(this.mergeStatic(data));
             } catch (e) {
                 console.error('Failed to parse message:', e);
             }
         };
     }
 
+    mergeStatic(data) {
+        for (const [key, fields] of Object.entries(this.staticStats)) {
+            const section = data[key];
+            if (section && typeof section === 'object' && !Array.isArray(section)) {
+                data[key] = { ...fields, ...section };
+            }
+        }
+        return data;
+    }
+
     updateConnectionStatus(connected) {
         const dot = document.getElementById('status-dot');
         const text = document.getElementById('status-text');
@@ -274,9 +296,9 @@ class PCMonitor {
         }
 
         // Ping
-        if (data.ping) {
-            if (data.ping.success && data.ping.ping !== null) {
-                this.setText('ping-value', `${data.ping.ping} ms`);
+        if ('ping_ok' in data) {
+            if (data.ping_ok && data.ping_ms !== null) {
+                this.setText('ping-value', `${data.ping_ms} ms`);
             } else {
                 this.setText('ping-value', '--');
             }